@@ -19,6 +19,7 @@ class Settings(BaseSettings):
 
     Settings are loaded from environment variables and .env file.
     Environment variables take precedence over .env file values.
+    Instances are immutable once loaded.
     """
 
     # Valid log levels
@@ -63,6 +64,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     @field_validator("neo4j_uri")
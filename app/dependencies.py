@@ -53,7 +53,10 @@ async def verify_api_key(
         raise HTTPException(status_code=403, detail=error_response.model_dump())
 
     # Check if API key matches configured value (case-sensitive, constant-time)
-    if not secrets.compare_digest(x_api_key, settings.api_key.get_secret_value()):
+    # Compare bytes: compare_digest rejects str arguments with non-ASCII characters
+    if not secrets.compare_digest(
+        x_api_key.encode(), settings.api_key.get_secret_value().encode()
+    ):
         error_response = ErrorResponse(
             error=Error(
                 code="INVALID_API_KEY",
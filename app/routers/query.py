@@ -235,7 +235,7 @@ async def execute_query(
     # Execute query
     settings = get_settings()
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         results = neo4j_client.execute_query(
             query=query_request.query,
@@ -244,7 +244,7 @@ async def execute_query(
             timeout=float(settings.query_timeout_seconds),
         )
 
-        execution_time_ms = (time.time() - start_time) * 1000
+        execution_time_ms = (time.perf_counter() - start_time) * 1000
 
         # Extract nodes and edges from results
         nodes, edges = _extract_graph_elements(results)
@@ -5,35 +5,82 @@ This module provides reusable fixtures for testing the Neo4j API.
 
 from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
-from app.config import Settings
+# Skip pydantic's self-check of every generated core schema while the app
+# models are built at import time. Must be set before any app import.
+os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
 
+from app.config import Settings, get_settings  # noqa: E402
 
-@pytest.fixture
-def settings_fixture(monkeypatch: pytest.MonkeyPatch) -> Settings:
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _base_test_env() -> Iterator[None]:
+    """Set the required Settings environment variables for the whole session.
+
+    Tests that need different values layer function-scoped monkeypatch
+    changes on top; those are undone after each test.
+
+    Yields:
+        None
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("API_KEY", "test-api-key-12345")
+        monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
+        monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
+        monkeypatch.setenv("NEO4J_PASSWORD", "test-password")
+        monkeypatch.setenv("NEO4J_DATABASE", "neo4j")
+        yield
+
+
+@pytest.fixture(scope="session")
+def settings_fixture(_base_test_env: None) -> Settings:
     """Provide a test Settings instance with valid configuration.
 
+    Built once per session from the base test environment; tests must treat
+    it as read-only. It reads the same sources as get_settings() (including
+    any local .env), so values compared against app-derived ones agree.
+
     Args:
-        monkeypatch: Pytest monkeypatch fixture for environment manipulation.
+        _base_test_env: Session-wide test environment variables.
 
     Returns:
         Settings instance configured for testing.
     """
-    # Set test environment variables
-    monkeypatch.setenv("API_KEY", "test-api-key-12345")
-    monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
-    monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
-    monkeypatch.setenv("NEO4J_PASSWORD", "test-password")
-    monkeypatch.setenv("NEO4J_DATABASE", "neo4j")
-
-    # Clear settings cache and create new instance
-    Settings.model_config["_env_file"] = None
     return Settings()
 
 
+@pytest.fixture(autouse=True)
+def _clear_settings_cache(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Clear the get_settings() cache around tests marked uses_get_settings.
+
+    For unmarked tests the cache is deliberately shared across the session.
+    App code fills it on first use (importing app.main, the health check,
+    query execution) from the session-wide base environment. An unmarked
+    test that changes settings env vars will therefore not see them through
+    get_settings(); such tests must carry the uses_get_settings marker.
+
+    Args:
+        request: Pytest request for the running test.
+
+    Yields:
+        None
+    """
+    if request.node.get_closest_marker("uses_get_settings") is None:
+        yield
+        return
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.fixture
 def mock_neo4j_result() -> MagicMock:
     """Provide a mock Neo4j query result.
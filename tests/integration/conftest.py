@@ -0,0 +1,46 @@
+"""
+Shared fixtures for integration tests.
+
+These fixtures require a running Neo4j instance via docker-compose.test.yml
+Run: docker compose -f docker-compose.test.yml up -d --wait
+
+Port: 7691 (unique to neo4j-api)
+"""
+
+import os
+
+from neo4j import GraphDatabase
+import pytest
+
+# Test database configuration
+TEST_URI = os.getenv("NEO4J_URI", "bolt://localhost:7691")
+TEST_USER = os.getenv("NEO4J_USERNAME", "neo4j")
+TEST_PASSWORD = os.getenv("NEO4J_PASSWORD", "testpassword")
+
+
+@pytest.fixture(scope="session")
+def driver():
+    """Create one Neo4j driver (and connection pool) for the whole test run."""
+    drv = GraphDatabase.driver(TEST_URI, auth=(TEST_USER, TEST_PASSWORD))
+    try:
+        # Connect eagerly so the first test doesn't pay the lazy-connect cost
+        drv.verify_connectivity()
+        yield drv
+    finally:
+        drv.close()
+
+
+@pytest.fixture
+def session(driver):
+    """Create a session for each test."""
+    sess = driver.session()
+    yield sess
+    sess.close()
+
+
+@pytest.fixture
+def probe_session(driver):
+    """Create a session for trivial probes that read a single record."""
+    sess = driver.session(fetch_size=1)
+    yield sess
+    sess.close()
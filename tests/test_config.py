@@ -11,24 +11,28 @@ import pytest
 
 from app.config import Settings, get_settings
 
+_VALID_SCHEME_URIS = (
+    "bolt://localhost:7687",
+    "bolt+s://localhost:7687",
+    "bolt+ssc://localhost:7687",
+    "neo4j://localhost:7687",
+    "neo4j+s://localhost:7687",
+    "neo4j+ssc://localhost:7687",
+)
+_INVALID_SCHEME_URIS = (
+    "http://localhost:7687",
+    "https://localhost:7687",
+    "localhost:7687",
+    "tcp://localhost:7687",
+)
+_INVALID_LOG_LEVELS = ("trace", "verbose", "fatal", "invalid")
 
-class TestSettingsValidEnvironment:
-    """Test Settings class with valid environment variables."""
-
-    @pytest.fixture(autouse=True)
-    def setup_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Set up valid environment variables for all tests."""
-        # Clear lru_cache before each test
-        get_settings.cache_clear()
 
-        # Neo4j settings
-        monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
-        monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
-        monkeypatch.setenv("NEO4J_PASSWORD", "password123")
-        monkeypatch.setenv("NEO4J_DATABASE", "neo4j")
+class TestSettingsValidEnvironment:
+    """Test Settings class with valid environment variables.
 
-        # API settings
-        monkeypatch.setenv("API_KEY", "test-api-key-12345")
+    Relies on the session-wide base environment from conftest.py.
+    """
 
     def test_settings_loads_from_environment(self) -> None:
         """Test that Settings loads values from environment variables."""
@@ -36,13 +40,14 @@ class TestSettingsValidEnvironment:
 
         assert settings.neo4j_uri == "bolt://localhost:7687"
         assert settings.neo4j_username == "neo4j"
-        assert settings.neo4j_password.get_secret_value() == "password123"
+        assert settings.neo4j_password.get_secret_value() == "test-password"
         assert settings.neo4j_database == "neo4j"
         assert settings.api_key.get_secret_value() == "test-api-key-12345"
 
     def test_settings_uses_default_values(self) -> None:
         """Test that optional settings use default values."""
-        settings = Settings()
+        # Skip .env so only the class defaults back the optional fields
+        settings = Settings(_env_file=None)
 
         # Neo4j defaults
         assert settings.neo4j_max_connection_lifetime == 3600
@@ -78,8 +83,12 @@ class TestSettingsValidEnvironment:
         assert settings.workers == 8
         assert settings.log_level == "debug"
 
-    def test_secret_str_fields_are_hidden(self) -> None:
+    def test_secret_str_fields_are_hidden(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that SecretStr fields are hidden in repr."""
+        monkeypatch.setenv("NEO4J_PASSWORD", "password123")
+
         settings = Settings()
         settings_repr = repr(settings)
 
@@ -91,31 +100,24 @@ class TestSettingsValidEnvironment:
         assert settings.neo4j_password.get_secret_value() == "password123"
         assert settings.api_key.get_secret_value() == "test-api-key-12345"
 
+    def test_settings_are_immutable(self) -> None:
+        """Test that Settings instances cannot be modified after loading."""
+        settings = Settings()
+        original_port = settings.port
 
-class TestSettingsValidation:
-    """Test Settings field validation."""
+        with pytest.raises(ValidationError):
+            settings.port = original_port + 1  # type: ignore[misc]
 
-    @pytest.fixture(autouse=True)
-    def setup_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Set up minimal valid environment variables."""
-        get_settings.cache_clear()
+        assert settings.port == original_port
 
-        monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
-        monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
-        monkeypatch.setenv("NEO4J_PASSWORD", "password123")
-        monkeypatch.setenv("API_KEY", "test-api-key")
 
-    @pytest.mark.parametrize(
-        "uri",
-        [
-            "bolt://localhost:7687",
-            "bolt+s://localhost:7687",
-            "bolt+ssc://localhost:7687",
-            "neo4j://localhost:7687",
-            "neo4j+s://localhost:7687",
-            "neo4j+ssc://localhost:7687",
-        ],
-    )
+class TestSettingsValidation:
+    """Test Settings field validation.
+
+    Relies on the session-wide base environment from conftest.py.
+    """
+
+    @pytest.mark.parametrize("uri", _VALID_SCHEME_URIS)
     def test_valid_uri_schemes_accepted(
         self, monkeypatch: pytest.MonkeyPatch, uri: str
     ) -> None:
@@ -141,22 +143,17 @@ class TestSettingsValidation:
         settings = Settings()
         assert settings.neo4j_uri == uri
 
-    def test_invalid_uri_scheme_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize("uri", _INVALID_SCHEME_URIS)
+    def test_invalid_uri_scheme_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, uri: str
+    ) -> None:
         """Test that invalid URI scheme is rejected."""
-        invalid_uris = [
-            "http://localhost:7687",
-            "https://localhost:7687",
-            "localhost:7687",
-            "tcp://localhost:7687",
-        ]
-
-        for uri in invalid_uris:
-            monkeypatch.setenv("NEO4J_URI", uri)
-            with pytest.raises(ValidationError) as exc_info:
-                Settings()
+        monkeypatch.setenv("NEO4J_URI", uri)
+        with pytest.raises(ValidationError) as exc_info:
+            Settings()
 
-            errors = exc_info.value.errors()
-            assert any("Neo4j URI must use one of:" in str(error) for error in errors)
+        errors = exc_info.value.errors()
+        assert any("Neo4j URI must use one of:" in str(error) for error in errors)
 
     def test_malformed_uri_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that malformed Neo4j URIs are rejected."""
@@ -178,14 +175,14 @@ class TestSettingsValidation:
                 expected_error in str(error) for error in errors
             ), f"Expected error '{expected_error}' not found for URI '{uri}'"
 
-    def test_valid_log_levels_accepted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize("level", ["debug", "info", "warning", "error", "critical"])
+    def test_valid_log_levels_accepted(
+        self, monkeypatch: pytest.MonkeyPatch, level: str
+    ) -> None:
         """Test that valid log levels are accepted."""
-        valid_levels = ["debug", "info", "warning", "error", "critical"]
-
-        for level in valid_levels:
-            monkeypatch.setenv("LOG_LEVEL", level)
-            settings = Settings()
-            assert settings.log_level == level.lower()
+        monkeypatch.setenv("LOG_LEVEL", level)
+        settings = Settings()
+        assert settings.log_level == level.lower()
 
     def test_log_level_case_insensitive(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that log level validation is case insensitive."""
@@ -194,37 +191,38 @@ class TestSettingsValidation:
         assert settings.log_level == "info"
 
         monkeypatch.setenv("LOG_LEVEL", "DeBuG")
-        get_settings.cache_clear()
         settings = Settings()
         assert settings.log_level == "debug"
 
-    def test_invalid_log_level_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize("level", _INVALID_LOG_LEVELS)
+    def test_invalid_log_level_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, level: str
+    ) -> None:
         """Test that invalid log level is rejected."""
-        invalid_levels = ["trace", "verbose", "fatal", "invalid"]
+        monkeypatch.setenv("LOG_LEVEL", level)
+        with pytest.raises(ValidationError) as exc_info:
+            Settings()
 
-        for level in invalid_levels:
-            monkeypatch.setenv("LOG_LEVEL", level)
-            with pytest.raises(ValidationError) as exc_info:
-                Settings()
+        errors = exc_info.value.errors()
+        assert any("Log level must be one of:" in str(error) for error in errors)
 
-            errors = exc_info.value.errors()
-            assert any("Log level must be one of:" in str(error) for error in errors)
-
-    def test_port_range_validation(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test that port must be between 1 and 65535."""
-        # Valid ports
-        valid_ports = ["1", "8000", "65535"]
-        for port in valid_ports:
-            monkeypatch.setenv("PORT", port)
-            settings = Settings()
-            assert settings.port == int(port)
-
-        # Invalid ports
-        invalid_ports = ["0", "-1", "65536", "99999"]
-        for port in invalid_ports:
-            monkeypatch.setenv("PORT", port)
-            with pytest.raises(ValidationError):
-                Settings()
+    @pytest.mark.parametrize("port", ["1", "8000", "65535"])
+    def test_valid_port_accepted(
+        self, monkeypatch: pytest.MonkeyPatch, port: str
+    ) -> None:
+        """Test that ports between 1 and 65535 are accepted."""
+        monkeypatch.setenv("PORT", port)
+        settings = Settings()
+        assert settings.port == int(port)
+
+    @pytest.mark.parametrize("port", ["0", "-1", "65536", "99999"])
+    def test_invalid_port_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, port: str
+    ) -> None:
+        """Test that ports outside 1-65535 are rejected."""
+        monkeypatch.setenv("PORT", port)
+        with pytest.raises(ValidationError):
+            Settings()
 
     def test_positive_integer_validation(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that connection pool settings must be positive integers."""
@@ -256,11 +254,6 @@ class TestSettingsValidation:
 class TestSettingsMissingRequired:
     """Test Settings with missing required fields."""
 
-    @pytest.fixture(autouse=True)
-    def clear_cache(self) -> None:
-        """Clear lru_cache before each test."""
-        get_settings.cache_clear()
-
     def test_missing_neo4j_uri_raises_error(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -268,6 +261,7 @@ class TestSettingsMissingRequired:
         monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
         monkeypatch.setenv("NEO4J_PASSWORD", "password")
         monkeypatch.setenv("API_KEY", "key")
+        monkeypatch.delenv("NEO4J_URI", raising=False)
 
         with pytest.raises(ValidationError) as exc_info:
             Settings()
@@ -282,6 +276,7 @@ class TestSettingsMissingRequired:
         monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
         monkeypatch.setenv("NEO4J_PASSWORD", "password")
         monkeypatch.setenv("API_KEY", "key")
+        monkeypatch.delenv("NEO4J_USERNAME", raising=False)
 
         with pytest.raises(ValidationError) as exc_info:
             Settings()
@@ -296,6 +291,7 @@ class TestSettingsMissingRequired:
         monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
         monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
         monkeypatch.setenv("API_KEY", "key")
+        monkeypatch.delenv("NEO4J_PASSWORD", raising=False)
 
         with pytest.raises(ValidationError) as exc_info:
             Settings()
@@ -310,6 +306,7 @@ class TestSettingsMissingRequired:
         monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
         monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
         monkeypatch.setenv("NEO4J_PASSWORD", "password")
+        monkeypatch.delenv("API_KEY", raising=False)
 
         with pytest.raises(ValidationError) as exc_info:
             Settings()
@@ -318,14 +315,13 @@ class TestSettingsMissingRequired:
         assert any(error["loc"] == ("api_key",) for error in errors)
 
 
+@pytest.mark.uses_get_settings
 class TestGetSettingsFunction:
     """Test get_settings() singleton function."""
 
     @pytest.fixture(autouse=True)
     def setup_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Set up valid environment variables."""
-        get_settings.cache_clear()
-
         monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
         monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
         monkeypatch.setenv("NEO4J_PASSWORD", "password123")
@@ -368,8 +364,6 @@ class TestSettingsEdgeCases:
     @pytest.fixture(autouse=True)
     def setup_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Set up minimal valid environment variables."""
-        get_settings.cache_clear()
-
         monkeypatch.setenv("NEO4J_URI", "bolt://localhost:7687")
         monkeypatch.setenv("NEO4J_USERNAME", "neo4j")
         monkeypatch.setenv("NEO4J_PASSWORD", "password123")
@@ -452,25 +446,31 @@ class TestSettingsEdgeCases:
 
         # Maximum valid port
         monkeypatch.setenv("PORT", "65535")
-        get_settings.cache_clear()
         settings = Settings()
         assert settings.port == 65535
 
-    def test_boolean_reload_field(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("true", True),
+            ("True", True),
+            ("TRUE", True),
+            ("1", True),
+            ("yes", True),
+            ("false", False),
+            ("False", False),
+            ("FALSE", False),
+            ("0", False),
+            ("no", False),
+        ],
+    )
+    def test_boolean_reload_field(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, expected: bool
+    ) -> None:
         """Test that reload boolean field works correctly."""
-        # Test true values
-        for value in ["true", "True", "TRUE", "1", "yes"]:
-            monkeypatch.setenv("RELOAD", value)
-            get_settings.cache_clear()
-            settings = Settings()
-            assert settings.reload is True
-
-        # Test false values
-        for value in ["false", "False", "FALSE", "0", "no"]:
-            monkeypatch.setenv("RELOAD", value)
-            get_settings.cache_clear()
-            settings = Settings()
-            assert settings.reload is False
+        monkeypatch.setenv("RELOAD", value)
+        settings = Settings()
+        assert settings.reload is expected
 
     def test_case_insensitive_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that environment variables are case insensitive."""
@@ -5,13 +5,67 @@ This module tests the API key authentication dependency.
 
 from __future__ import annotations
 
-from fastapi import HTTPException
-from fastapi.testclient import TestClient
+import secrets
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from fastapi import Depends, FastAPI, HTTPException
 import pytest
+import pytest_asyncio
 
-from app.config import Settings  # noqa: TCH001
+from app.config import Settings, get_settings  # noqa: TCH001
 from app.dependencies import verify_api_key
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    import httpx
+
+
+@pytest.fixture(scope="module")
+def protected_app(settings_fixture: Settings) -> FastAPI:
+    """Provide a minimal FastAPI app with a route guarded by verify_api_key.
+
+    Built once per module, with get_settings overridden to return the
+    session-wide test settings.
+
+    Args:
+        settings_fixture: Test settings with configured API key.
+
+    Returns:
+        FastAPI app exposing GET /protected.
+    """
+    app = FastAPI()
+
+    @app.get("/protected")
+    async def protected_route(
+        _: None = Depends(verify_api_key),
+    ) -> dict[str, str]:
+        return {"message": "Access granted"}
+
+    app.dependency_overrides[get_settings] = lambda: settings_fixture
+    return app
+
+
+@pytest_asyncio.fixture
+async def protected_client(
+    protected_app: FastAPI,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Provide an async client that calls the shared protected app over ASGI.
+
+    Args:
+        protected_app: Shared app with the protected route.
+
+    Yields:
+        httpx.AsyncClient bound to the protected app.
+    """
+    # Imported lazily: only the integration tests need an HTTP client
+    import httpx
+
+    transport = httpx.ASGITransport(app=protected_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
 
 class TestVerifyApiKey:
     """Test suite for verify_api_key dependency function."""
@@ -168,73 +222,81 @@ class TestVerifyApiKey:
         assert exc_info.value.status_code == 403
         assert exc_info.value.detail["error"]["code"] == "INVALID_API_KEY"
 
+    @pytest.mark.asyncio
+    async def test_timing_safe_comparison_used(
+        self, settings_fixture: Settings
+    ) -> None:
+        """Test that the API key is compared with secrets.compare_digest.
 
-class TestVerifyApiKeyIntegration:
-    """Integration tests for verify_api_key with FastAPI TestClient."""
+        Args:
+            settings_fixture: Test settings with configured API key.
+        """
+        # Arrange
+        with patch(
+            "app.dependencies.secrets.compare_digest",
+            wraps=secrets.compare_digest,
+        ) as spy:
+            # Act
+            await verify_api_key(
+                x_api_key="test-api-key-12345", settings=settings_fixture
+            )
 
-    def test_protected_endpoint_with_valid_api_key(
+        # Assert
+        spy.assert_called_once_with(b"test-api-key-12345", b"test-api-key-12345")
+
+    @pytest.mark.asyncio
+    async def test_non_ascii_api_key_denies_access(
         self, settings_fixture: Settings
     ) -> None:
-        """Test that a protected endpoint allows access with valid API key.
-
-        This integration test verifies the dependency works correctly when
-        used in a FastAPI route.
+        """Test that a non-ASCII API key is rejected rather than erroring.
 
         Args:
             settings_fixture: Test settings with configured API key.
         """
-        # Arrange - create a minimal FastAPI app for testing
-        from fastapi import Depends, FastAPI
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key(x_api_key="tést-àpi-kéy", settings=settings_fixture)
 
-        app = FastAPI()
+        # Verify 403 status
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail["error"]["code"] == "INVALID_API_KEY"
 
-        # Override settings dependency
-        from app.config import get_settings
 
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
+class TestVerifyApiKeyIntegration:
+    """Integration tests for verify_api_key through an ASGI client."""
 
-        @app.get("/protected")
-        async def protected_route(
-            _: None = Depends(verify_api_key),
-        ) -> dict[str, str]:
-            return {"message": "Access granted"}
+    @pytest.mark.asyncio
+    async def test_protected_endpoint_with_valid_api_key(
+        self, protected_client: httpx.AsyncClient
+    ) -> None:
+        """Test that a protected endpoint allows access with valid API key.
 
-        client = TestClient(app)
+        This integration test verifies the dependency works correctly when
+        used in a FastAPI route.
 
+        Args:
+            protected_client: Async client for the shared protected app.
+        """
         # Act
-        response = client.get("/protected", headers={"X-API-Key": "test-api-key-12345"})
+        response = await protected_client.get(
+            "/protected", headers={"X-API-Key": "test-api-key-12345"}
+        )
 
         # Assert
         assert response.status_code == 200
         assert response.json() == {"message": "Access granted"}
 
-    def test_protected_endpoint_without_api_key(
-        self, settings_fixture: Settings
+    @pytest.mark.asyncio
+    async def test_protected_endpoint_without_api_key(
+        self, protected_client: httpx.AsyncClient
     ) -> None:
         """Test that a protected endpoint denies access without API key.
 
         Args:
-            settings_fixture: Test settings with configured API key.
+            protected_client: Async client for the shared protected app.
         """
-        # Arrange
-        from fastapi import Depends, FastAPI
-
-        app = FastAPI()
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        @app.get("/protected")
-        async def protected_route(
-            _: None = Depends(verify_api_key),
-        ) -> dict[str, str]:
-            return {"message": "Access granted"}
-
-        client = TestClient(app)
-
         # Act
-        response = client.get("/protected")
+        response = await protected_client.get("/protected")
 
         # Assert
         assert response.status_code == 403
@@ -242,33 +304,19 @@ class TestVerifyApiKeyIntegration:
         assert "detail" in error_data
         assert error_data["detail"]["error"]["code"] == "MISSING_API_KEY"
 
-    def test_protected_endpoint_with_invalid_api_key(
-        self, settings_fixture: Settings
+    @pytest.mark.asyncio
+    async def test_protected_endpoint_with_invalid_api_key(
+        self, protected_client: httpx.AsyncClient
     ) -> None:
         """Test that a protected endpoint denies access with invalid API key.
 
         Args:
-            settings_fixture: Test settings with configured API key.
+            protected_client: Async client for the shared protected app.
         """
-        # Arrange
-        from fastapi import Depends, FastAPI
-
-        app = FastAPI()
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        @app.get("/protected")
-        async def protected_route(
-            _: None = Depends(verify_api_key),
-        ) -> dict[str, str]:
-            return {"message": "Access granted"}
-
-        client = TestClient(app)
-
         # Act
-        response = client.get("/protected", headers={"X-API-Key": "wrong-key"})
+        response = await protected_client.get(
+            "/protected", headers={"X-API-Key": "wrong-key"}
+        )
 
         # Assert
         assert response.status_code == 403
@@ -276,39 +324,25 @@ class TestVerifyApiKeyIntegration:
         assert "detail" in error_data
         assert error_data["detail"]["error"]["code"] == "INVALID_API_KEY"
 
-    def test_header_name_is_case_insensitive(self, settings_fixture: Settings) -> None:
+    @pytest.mark.asyncio
+    async def test_header_name_is_case_insensitive(
+        self, protected_client: httpx.AsyncClient
+    ) -> None:
         """Test that the X-API-Key header name is case-insensitive.
 
         FastAPI's Header() automatically handles case-insensitive header lookup.
 
         Args:
-            settings_fixture: Test settings with configured API key.
+            protected_client: Async client for the shared protected app.
         """
-        # Arrange
-        from fastapi import Depends, FastAPI
-
-        app = FastAPI()
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        @app.get("/protected")
-        async def protected_route(
-            _: None = Depends(verify_api_key),
-        ) -> dict[str, str]:
-            return {"message": "Access granted"}
-
-        client = TestClient(app)
-
         # Act - test different header name cases
-        response1 = client.get(
+        response1 = await protected_client.get(
             "/protected", headers={"X-API-Key": "test-api-key-12345"}
         )
-        response2 = client.get(
+        response2 = await protected_client.get(
             "/protected", headers={"x-api-key": "test-api-key-12345"}
         )
-        response3 = client.get(
+        response3 = await protected_client.get(
             "/protected", headers={"X-Api-Key": "test-api-key-12345"}
         )
 
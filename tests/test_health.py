@@ -5,728 +5,343 @@ This module tests the GET /api/health endpoint following TDD principles.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from pydantic import ValidationError
+import httpx
+from pydantic import TypeAdapter, ValidationError
+import pytest
+import pytest_asyncio
 
-from app.config import Settings  # noqa: TCH001
-from app.models import HealthResponse
+from app.models import DatabaseListResponse, HealthResponse
+from app.routers.health import router
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
 
-class TestHealthCheckSuccess:
-    """Test successful health check scenarios."""
+    from app.config import Settings
 
-    def test_health_check_returns_200_when_neo4j_connected(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test health check returns 200 when Neo4j is connected.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange - create FastAPI app with health router
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
 
-        # Create mock Neo4j client
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.return_value = True
+pytestmark = [pytest.mark.health, pytest.mark.asyncio(loop_scope="module")]
 
-        # Store in app state (simulating lifespan behavior)
-        app.state.neo4j_client = mock_client
+_HEALTH_ADAPTER = TypeAdapter(HealthResponse)
+_DATABASES_ADAPTER = TypeAdapter(DatabaseListResponse)
 
-        # Override settings
-        from app.config import get_settings
+_CONN_REFUSED = ConnectionError("Connection refused to bolt://localhost:7687")
 
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
 
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/health")
+class _StubClient:
+    """Minimal Neo4j client stand-in for the health and databases endpoints."""
 
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["neo4j"] == "connected"
-
-    def test_health_check_response_format_matches_spec(
+    def __init__(
         self,
-        settings_fixture: Settings,
+        rv: bool = True,
+        exc: Exception | None = None,
+        records: list[dict[str, Any]] | None = None,
+        query_exc: Exception | None = None,
     ) -> None:
-        """Test that health check response format matches specification.
-
-        Response must include: status, neo4j, version fields.
+        """Initialize the stub.
 
         Args:
-            settings_fixture: Test settings with configured values.
+            rv: Value returned by ``verify_connectivity``.
+            exc: Exception raised by ``verify_connectivity`` instead, if set.
+            records: Records returned by ``execute_query``.
+            query_exc: Exception raised by ``execute_query`` instead, if set.
         """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.return_value = True
-        app.state.neo4j_client = mock_client
+        self._rv = rv
+        self._exc = exc
+        self._records = records or []
+        self._query_exc = query_exc
 
-        from app.config import get_settings
+    def verify_connectivity(self) -> bool:
+        """Return the configured result or raise the configured exception.
 
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
+        Returns:
+            The configured connectivity result.
 
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/health")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-
-        # Verify all required fields are present
-        assert "status" in data
-        assert "neo4j" in data
-        assert "version" in data
-
-        # Verify field values match spec
-        assert data["status"] in ["healthy", "unhealthy"]
-        assert data["neo4j"] in ["connected", "disconnected"]
-        assert isinstance(data["version"], str)
-        assert data["version"] == settings_fixture.api_version
-
-    def test_health_check_no_auth_required(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that health check endpoint does NOT require authentication.
-
-        The /api/health endpoint must be public - no X-API-Key header needed.
-
-        Args:
-            settings_fixture: Test settings with configured values.
+        Raises:
+            Exception: The configured exception, if any.
         """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.return_value = True
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
+        if self._exc is not None:
+            raise self._exc
+        return self._rv
 
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act - Make request WITHOUT X-API-Key header
-        response = client.get("/api/health")
-
-        # Assert - Should succeed without authentication
-        assert response.status_code == 200
-        # Verify it's not a 401 or 403 authentication error
-        assert response.status_code != 401
-        assert response.status_code != 403
-
-
-class TestHealthCheckFailure:
-    """Test health check failure scenarios."""
-
-    def test_health_check_returns_503_when_neo4j_disconnected(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test health check returns 503 when Neo4j connectivity fails.
+    def execute_query(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """Return the configured records or raise the configured exception.
 
         Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.return_value = False
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
+            query: Cypher query (ignored).
+            **kwargs: Query options such as ``database`` (ignored).
 
-        # Act
-        response = client.get("/api/health")
-
-        # Assert
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["neo4j"] == "disconnected"
-
-    def test_health_check_returns_error_message_on_failure(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that health check includes error message when unhealthy.
+        Returns:
+            The configured records.
 
-        Args:
-            settings_fixture: Test settings with configured values.
+        Raises:
+            Exception: The configured query exception, if any.
         """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.return_value = False
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/health")
-
-        # Assert
-        assert response.status_code == 503
-        data = response.json()
-        assert "error" in data
-        assert isinstance(data["error"], str)
-
-    def test_unhealthy_response_conforms_to_health_response_model(
+        if self._query_exc is not None:
+            raise self._query_exc
+        return self._records
+
+
+@pytest.fixture(scope="module")
+def health_app() -> FastAPI:
+    """Provide a FastAPI app with the health router, built once per module.
+
+    Returns:
+        FastAPI app exposing the health router.
+    """
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def health_client(health_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Provide an async client that calls the shared health app over ASGI.
+
+    The client is opened once per module and shared by every test, which all
+    run on the same module-scoped event loop.
+
+    Args:
+        health_app: Shared app with the health router.
+
+    Yields:
+        httpx.AsyncClient bound to the health app.
+    """
+    transport = httpx.ASGITransport(app=health_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_health_app(health_app: FastAPI) -> Iterator[None]:
+    """Reset per-test state on the shared health app after each test.
+
+    Args:
+        health_app: Shared app with the health router.
+
+    Yields:
+        None
+    """
+    yield
+    health_app.state.neo4j_client = None
+
+
+class TestHealthCheck:
+    """Test health check scenarios."""
+
+    @pytest.mark.parametrize(
+        ("neo4j_client", "status_code", "status", "neo4j", "error"),
+        [
+            pytest.param(
+                _StubClient(True), 200, "healthy", "connected", None, id="connected"
+            ),
+            pytest.param(
+                _StubClient(False),
+                503,
+                "unhealthy",
+                "disconnected",
+                "Neo4j connectivity check failed",
+                id="disconnected",
+            ),
+            pytest.param(
+                None,
+                503,
+                "unhealthy",
+                "disconnected",
+                "Neo4j client not initialized",
+                id="client_not_initialized",
+            ),
+            pytest.param(
+                _StubClient(exc=_CONN_REFUSED),
+                503,
+                "unhealthy",
+                "disconnected",
+                "Connection refused",
+                id="connectivity_exception",
+            ),
+        ],
+    )
+    async def test_health_check(
         self,
+        health_app: FastAPI,
+        health_client: httpx.AsyncClient,
         settings_fixture: Settings,
+        neo4j_client: _StubClient | None,
+        status_code: int,
+        status: str,
+        neo4j: str,
+        error: str | None,
     ) -> None:
-        """Verify 503 response conforms to HealthResponse model and contains all fields.
+        """Test health check status code and body for each Neo4j client state.
 
-        This ensures the OpenAPI documentation contract is honored and that clients
-        using code generation will get correct type definitions.
+        The endpoint must be public - requests carry no X-API-Key header - and
+        every response, healthy or not, must conform to the HealthResponse
+        model so the OpenAPI contract holds for generated clients.
 
         Args:
+            health_app: Shared app with the health router.
+            health_client: Async client for the shared app.
             settings_fixture: Test settings with configured values.
+            neo4j_client: Client stored in app state, or None if not initialized.
+            status_code: Expected HTTP status code.
+            status: Expected overall health status.
+            neo4j: Expected Neo4j connectivity status.
+            error: Expected substring of the error message, or None if healthy.
         """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.return_value = False
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
+        # Arrange - store client in app state (simulating lifespan behavior)
+        health_app.state.neo4j_client = neo4j_client
 
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/health")
-
-        # Assert - Response validates against HealthResponse model
-        assert response.status_code == 503
-        data = response.json()
+        # Act - Make request WITHOUT X-API-Key header
+        response = await health_client.get("/api/health")
 
-        # This should NOT raise ValidationError
+        # Assert
+        assert response.status_code == status_code
         try:
-            validated = HealthResponse(**data)
+            validated = _HEALTH_ADAPTER.validate_json(response.content)
         except ValidationError as e:
             raise AssertionError(
-                f"503 response does not validate against HealthResponse model: {e}"
+                f"Response does not validate against HealthResponse model: {e}"
             ) from e
 
-        # Assert field values on the validated model
-        assert validated.status == "unhealthy"
-        assert validated.neo4j == "disconnected"
+        assert validated.status == status
+        assert validated.neo4j == neo4j
         assert validated.version == settings_fixture.api_version
-        assert isinstance(validated.error, str)
-
-
-class TestHealthCheckEdgeCases:
-    """Test health check edge cases."""
-
-    def test_health_check_handles_neo4j_client_not_initialized(
+        if error is None:
+            assert validated.error is None
+        else:
+            assert validated.error is not None
+            assert error in validated.error
+
+
+class TestDatabasesList:
+    """Test databases list scenarios."""
+
+    @pytest.mark.parametrize(
+        ("records", "databases"),
+        [
+            pytest.param(
+                [
+                    {"name": "neo4j", "default": True, "currentStatus": "online"},
+                    {"name": "system", "default": False, "currentStatus": "online"},
+                ],
+                [
+                    {"name": "neo4j", "default": True, "status": "online"},
+                    {"name": "system", "default": False, "status": "online"},
+                ],
+                id="default_and_system",
+            ),
+            pytest.param(
+                [
+                    {"name": "neo4j", "default": True, "currentStatus": "online"},
+                    {"name": "system", "default": False, "currentStatus": "online"},
+                    {
+                        "name": "investigation_001",
+                        "default": False,
+                        "currentStatus": "online",
+                    },
+                ],
+                [
+                    {"name": "neo4j", "default": True, "status": "online"},
+                    {"name": "system", "default": False, "status": "online"},
+                    {"name": "investigation_001", "default": False, "status": "online"},
+                ],
+                id="multiple_databases",
+            ),
+            pytest.param([], [], id="empty_database_list"),
+            # Neo4j response might not have all fields
+            pytest.param(
+                [{"name": "neo4j", "default": True}],
+                [{"name": "neo4j", "default": True, "status": None}],
+                id="missing_optional_fields",
+            ),
+        ],
+    )
+    async def test_databases_returns_200_on_success(
         self,
-        settings_fixture: Settings,
+        health_app: FastAPI,
+        health_client: httpx.AsyncClient,
+        records: list[dict[str, Any]],
+        databases: list[dict[str, Any]],
     ) -> None:
-        """Test health check returns 503 when Neo4j client is None.
-
-        This can happen if Neo4j connection failed during app startup.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        # Set client to None (simulating failed initialization)
-        app.state.neo4j_client = None
-
-        from app.config import get_settings
+        """Test databases list maps SHOW DATABASES records to the response.
 
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/health")
-
-        # Assert - Should return 503, not crash
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["neo4j"] == "disconnected"
-        assert "error" in data
-
-    def test_health_check_handles_verify_connectivity_exception(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test health check handles exceptions from verify_connectivity.
+        The endpoint must be public - requests carry no X-API-Key header. The
+        response holds a databases array whose entries carry name, default
+        and status fields, with status None when Neo4j omits it.
 
         Args:
-            settings_fixture: Test settings with configured values.
+            health_app: Shared app with the health router.
+            health_client: Async client for the shared app.
+            records: Records returned by the mocked SHOW DATABASES query.
+            databases: Expected databases array in the response body.
         """
         # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.verify_connectivity.side_effect = Exception(
-            "Connection refused to bolt://localhost:7687"
-        )
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/health")
-
-        # Assert - Should return 503 with error message
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["neo4j"] == "disconnected"
-        assert "error" in data
-        assert "Connection refused" in data["error"]
-
-
-class TestDatabasesListSuccess:
-    """Test successful databases list scenarios."""
-
-    def test_databases_returns_200_on_success(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test databases list returns 200 when query succeeds.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True, "currentStatus": "online"},
-            {"name": "system", "default": False, "currentStatus": "online"},
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 200
-
-    def test_databases_response_format_matches_spec(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that databases response format matches specification.
-
-        Response must include: databases array with name, default, status fields.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True, "currentStatus": "online"},
-            {"name": "investigation_001", "default": False, "currentStatus": "online"},
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-
-        # Verify databases array exists
-        assert "databases" in data
-        assert isinstance(data["databases"], list)
-
-        # Verify each database has required fields
-        for db in data["databases"]:
-            assert "name" in db
-            assert "default" in db
-            assert isinstance(db["name"], str)
-            assert isinstance(db["default"], bool)
-
-    def test_databases_no_auth_required(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that databases endpoint does NOT require authentication.
-
-        The /api/databases endpoint must be public - no X-API-Key header needed.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True, "currentStatus": "online"},
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
+        health_app.state.neo4j_client = _StubClient(records=records)
 
         # Act - Make request WITHOUT X-API-Key header
-        response = client.get("/api/databases")
-
-        # Assert - Should succeed without authentication
-        assert response.status_code == 200
-        assert response.status_code != 401
-        assert response.status_code != 403
-
-    def test_databases_returns_list_of_databases(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that databases endpoint returns correct list of databases.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True, "currentStatus": "online"},
-            {"name": "system", "default": False, "currentStatus": "online"},
-            {"name": "investigation_001", "default": False, "currentStatus": "online"},
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["databases"]) == 3
-
-        # Check database names
-        db_names = [db["name"] for db in data["databases"]]
-        assert "neo4j" in db_names
-        assert "system" in db_names
-        assert "investigation_001" in db_names
-
-    def test_databases_default_database_marked_correctly(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that the default database is marked correctly.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True, "currentStatus": "online"},
-            {"name": "system", "default": False, "currentStatus": "online"},
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-
-        # Find neo4j database and verify it's marked as default
-        neo4j_db = next(db for db in data["databases"] if db["name"] == "neo4j")
-        assert neo4j_db["default"] is True
-
-        # Find system database and verify it's not default
-        system_db = next(db for db in data["databases"] if db["name"] == "system")
-        assert system_db["default"] is False
-
-    def test_databases_includes_status_field(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test that databases response includes status field.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True, "currentStatus": "online"},
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
+        response = await health_client.get("/api/databases")
 
         # Assert
         assert response.status_code == 200
-        data = response.json()
-        assert data["databases"][0]["status"] == "online"
-
-
-class TestDatabasesListFailure:
-    """Test databases list failure scenarios."""
-
-    def test_databases_returns_500_on_query_failure(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test databases returns 500 when query execution fails.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.side_effect = Exception("Permission denied")
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 500
-        data = response.json()
-        assert "error" in data
-        assert data["error"]["code"] == "DATABASE_QUERY_ERROR"
-        assert data["error"]["message"] == "Failed to list databases"
-        assert data["error"]["details"] == {"reason": "Permission denied"}
-
-    def test_databases_returns_503_when_neo4j_unavailable(
+        assert response.json() == {"databases": databases}
+        # Strict mode: no coercion, e.g. "true" is not accepted as a bool
+        _DATABASES_ADAPTER.validate_json(response.content, strict=True)
+
+    @pytest.mark.parametrize(
+        ("query_exc", "status_code", "error"),
+        [
+            pytest.param(
+                Exception("Permission denied"),
+                500,
+                {
+                    "code": "DATABASE_QUERY_ERROR",
+                    "message": "Failed to list databases",
+                    "details": {"reason": "Permission denied"},
+                },
+                id="query_failure",
+            ),
+            pytest.param(
+                None,
+                503,
+                {
+                    "code": "NEO4J_UNAVAILABLE",
+                    "message": "Neo4j client not initialized",
+                    "details": {},
+                },
+                id="neo4j_unavailable",
+            ),
+        ],
+    )
+    async def test_databases_returns_error(
         self,
-        settings_fixture: Settings,
+        health_app: FastAPI,
+        health_client: httpx.AsyncClient,
+        query_exc: Exception | None,
+        status_code: int,
+        error: dict[str, Any],
     ) -> None:
-        """Test databases returns 503 when Neo4j client is not available.
+        """Test databases returns an error body when Neo4j cannot be queried.
 
         Args:
-            settings_fixture: Test settings with configured values.
+            health_app: Shared app with the health router.
+            health_client: Async client for the shared app.
+            query_exc: Exception raised by the query, or None to leave the
+                client uninitialized.
+            status_code: Expected HTTP status code.
+            error: Expected error object in the response body.
         """
         # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        # Set client to None (simulating failed initialization)
-        app.state.neo4j_client = None
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
+        if query_exc is None:
+            # Simulate failed initialization
+            health_app.state.neo4j_client = None
+        else:
+            health_app.state.neo4j_client = _StubClient(query_exc=query_exc)
 
         # Act
-        response = client.get("/api/databases")
+        response = await health_client.get("/api/databases")
 
         # Assert
-        assert response.status_code == 503
-        data = response.json()
-        assert "error" in data
-        assert data["error"]["code"] == "NEO4J_UNAVAILABLE"
-        assert data["error"]["details"] == {}
-
-
-class TestDatabasesListEdgeCases:
-    """Test databases list edge cases."""
-
-    def test_databases_handles_empty_database_list(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test databases handles empty database list.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        mock_client.execute_query.return_value = []
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "databases" in data
-        assert data["databases"] == []
-
-    def test_databases_handles_missing_optional_fields(
-        self,
-        settings_fixture: Settings,
-    ) -> None:
-        """Test databases handles missing optional fields in Neo4j response.
-
-        Args:
-            settings_fixture: Test settings with configured values.
-        """
-        # Arrange
-        from app.routers.health import router
-
-        app = FastAPI()
-        app.include_router(router)
-
-        mock_client = MagicMock()
-        # Neo4j response might not have all fields
-        mock_client.execute_query.return_value = [
-            {"name": "neo4j", "default": True},  # Missing currentStatus
-        ]
-        app.state.neo4j_client = mock_client
-
-        from app.config import get_settings
-
-        app.dependency_overrides[get_settings] = lambda: settings_fixture
-
-        client = TestClient(app)
-
-        # Act
-        response = client.get("/api/databases")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["databases"][0]["name"] == "neo4j"
-        assert data["databases"][0]["default"] is True
-        # Status should be None or missing when not provided
-        assert data["databases"][0].get("status") is None
+        assert response.status_code == status_code
+        assert response.json() == {"error": error}
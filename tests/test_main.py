@@ -6,245 +6,266 @@ and Neo4j client dependency.
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
 from fastapi import FastAPI
 import pytest
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from app.config import Settings
 
 
-@pytest.fixture
-def mock_neo4j_client_class() -> MagicMock:
-    """Provide a mock Neo4jClient class.
+@pytest.fixture(scope="session")
+def main_module(settings_fixture: Settings) -> ModuleType:
+    """Import app.main once for the whole test session.
 
-    Returns:
-        Mock Neo4jClient class with verify_connectivity() and close() methods.
-    """
-    mock_client = MagicMock()
-    mock_client.verify_connectivity.return_value = True
-    mock_client.close.return_value = None
-    return mock_client
-
-
-def test_app_instance_exists(settings_fixture: Settings) -> None:
-    """Test that FastAPI app instance is created.
+    app.main reads settings at import time, so the import is deferred until
+    the test environment is in place rather than done at collection.
 
     Args:
-        settings_fixture: Test settings fixture.
+        settings_fixture: Test settings fixture; ensures the test environment.
+
+    Returns:
+        The app.main module.
     """
-    from app.main import app
+    import app.main
 
-    assert isinstance(app, FastAPI)
+    return app.main
 
 
-def test_app_configuration(settings_fixture: Settings) -> None:
-    """Test that app is configured with correct metadata.
+@pytest.fixture(scope="module")
+def mock_neo4j_client() -> Mock:
+    """Provide a mock Neo4jClient instance shared across the module.
 
-    Args:
-        settings_fixture: Test settings fixture.
+    Its configuration is restored before each use by
+    reset_mock_neo4j_client, which mock_neo4j_client_cls depends on.
+
+    Returns:
+        Mock Neo4jClient instance with verify_connectivity() and close() methods.
     """
-    from app.main import app
+    return Mock()
 
-    assert app.title == settings_fixture.api_title
-    assert app.version == settings_fixture.api_version
 
+@pytest.fixture
+def reset_mock_neo4j_client(mock_neo4j_client: Mock) -> None:
+    """Reset the shared Neo4jClient mock to its default behavior.
 
-def test_app_openapi_urls(settings_fixture: Settings) -> None:
-    """Test that OpenAPI documentation URLs are configured correctly.
+    Clears recorded calls and any per-test return values or side effects,
+    then makes verify_connectivity() succeed and close() return None.
 
     Args:
-        settings_fixture: Test settings fixture.
+        mock_neo4j_client: Shared mock Neo4jClient instance.
     """
-    from app.main import app
-
-    expected_prefix = settings_fixture.api_prefix
-    assert app.docs_url == f"{expected_prefix}/docs"
-    assert app.redoc_url == f"{expected_prefix}/redoc"
-    assert app.openapi_url == f"{expected_prefix}/openapi.json"
+    mock_neo4j_client.reset_mock(return_value=True, side_effect=True)
+    mock_neo4j_client.verify_connectivity.return_value = True
+    mock_neo4j_client.close.return_value = None
 
 
-@pytest.mark.asyncio
-async def test_lifespan_creates_neo4j_client(
-    settings_fixture: Settings,
-    mock_neo4j_client_class: MagicMock,
-) -> None:
-    """Test that lifespan startup creates Neo4j client.
+def test_app_instance_exists(main_module: ModuleType) -> None:
+    """Test that FastAPI app instance is created.
 
     Args:
-        settings_fixture: Test settings fixture.
-        mock_neo4j_client_class: Mock Neo4jClient class.
+        main_module: The app.main module.
     """
-    with patch("app.main.Neo4jClient", return_value=mock_neo4j_client_class):
-        from app.main import lifespan
-
-        # Create a test app for lifespan
-        test_app = FastAPI()
+    assert isinstance(main_module.app, FastAPI)
 
-        async with lifespan(test_app):
-            # During lifespan, client should be created and connectivity verified
-            assert hasattr(test_app.state, "neo4j_client")
-            assert test_app.state.neo4j_client is mock_neo4j_client_class
 
-        # Verify Neo4jClient was instantiated
-        # Verify connectivity was checked
-        mock_neo4j_client_class.verify_connectivity.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_lifespan_closes_neo4j_client(
-    settings_fixture: Settings,
-    mock_neo4j_client_class: MagicMock,
-) -> None:
-    """Test that lifespan shutdown closes Neo4j client.
+def test_app_configuration(settings_fixture: Settings, main_module: ModuleType) -> None:
+    """Test that app is configured with correct metadata.
 
     Args:
         settings_fixture: Test settings fixture.
-        mock_neo4j_client_class: Mock Neo4jClient class.
+        main_module: The app.main module.
     """
-    with patch("app.main.Neo4jClient", return_value=mock_neo4j_client_class):
-        from app.main import lifespan
-
-        test_app = FastAPI()
-
-        async with lifespan(test_app):
-            # Client should be set during lifespan
-            assert test_app.state.neo4j_client is mock_neo4j_client_class
-
-        # After lifespan exits, client should be closed
-        mock_neo4j_client_class.close.assert_called_once()
+    assert main_module.app.title == settings_fixture.api_title
+    assert main_module.app.version == settings_fixture.api_version
 
 
-@pytest.mark.asyncio
-async def test_lifespan_handles_connectivity_check_exception(
-    settings_fixture: Settings,
-) -> None:
-    """Test that lifespan handles exceptions during connectivity check.
+def test_app_openapi_urls(settings_fixture: Settings, main_module: ModuleType) -> None:
+    """Test that OpenAPI documentation URLs are configured correctly.
 
     Args:
         settings_fixture: Test settings fixture.
+        main_module: The app.main module.
     """
-    mock_client = MagicMock()
-    mock_client.verify_connectivity.side_effect = Exception("Connection failed")
+    expected_prefix = settings_fixture.api_prefix
+    assert main_module.app.docs_url == f"{expected_prefix}/docs"
+    assert main_module.app.redoc_url == f"{expected_prefix}/redoc"
+    assert main_module.app.openapi_url == f"{expected_prefix}/openapi.json"
 
-    with patch("app.main.Neo4jClient", return_value=mock_client):
-        from app.main import lifespan
 
-        test_app = FastAPI()
+@pytest.fixture(scope="module")
+def bare_app() -> FastAPI:
+    """Provide a bare FastAPI app to run the lifespan and dependencies against.
 
-        # Should not raise, just log error
-        async with lifespan(test_app):
-            # Client should be set to None after exception
-            assert hasattr(test_app.state, "neo4j_client")
-            assert test_app.state.neo4j_client is None
+    Built once per module; reset_bare_app removes its state before each test.
 
-        # Client creation was attempted
-        mock_client.verify_connectivity.assert_called_once()
+    Returns:
+        FastAPI app with empty state.
+    """
+    return FastAPI()
 
 
-@pytest.mark.asyncio
-async def test_lifespan_handles_client_creation_error(
-    settings_fixture: Settings,
-) -> None:
-    """Test that lifespan handles exceptions during Neo4j client creation.
+@pytest.fixture(autouse=True)
+def reset_bare_app(bare_app: FastAPI) -> None:
+    """Remove per-test state from the shared bare app before each test.
+
+    The attribute is deleted rather than set to None, so a test only sees
+    neo4j_client if the code under test (or the test itself) sets it.
 
     Args:
-        settings_fixture: Test settings fixture.
+        bare_app: Shared bare app.
     """
-    with patch("app.main.Neo4jClient", side_effect=Exception("Invalid configuration")):
-        from app.main import lifespan
+    if hasattr(bare_app.state, "neo4j_client"):
+        del bare_app.state.neo4j_client
 
-        test_app = FastAPI()
 
-        # Should not raise, just log error
-        async with lifespan(test_app):
-            # Client should be set to None after creation error
-            assert hasattr(test_app.state, "neo4j_client")
-            assert test_app.state.neo4j_client is None
+@pytest.fixture
+def mock_neo4j_client_cls(
+    monkeypatch: pytest.MonkeyPatch,
+    main_module: ModuleType,
+    mock_neo4j_client: Mock,
+    reset_mock_neo4j_client: None,
+) -> Mock:
+    """Replace the Neo4jClient class in app.main with a mock constructor.
 
-
-@pytest.mark.asyncio
-async def test_lifespan_handles_neo4j_connectivity_failure(
-    settings_fixture: Settings,
-) -> None:
-    """Test that lifespan handles Neo4j connectivity check failure.
+    The constructor returns the shared mock client instance.
 
     Args:
-        settings_fixture: Test settings fixture.
+        monkeypatch: Pytest fixture that restores Neo4jClient at teardown.
+        main_module: The app.main module.
+        mock_neo4j_client: Shared mock Neo4jClient instance.
+        reset_mock_neo4j_client: Restores the shared mock's defaults first.
+
+    Returns:
+        Mock Neo4jClient class installed as app.main.Neo4jClient.
     """
-    mock_client = MagicMock()
-    mock_client.verify_connectivity.return_value = False
+    client_cls = Mock(return_value=mock_neo4j_client)
+    monkeypatch.setattr(main_module, "Neo4jClient", client_cls)
+    return client_cls
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    ("verify_result", "creation_error", "client_stored", "verify_calls", "close_calls"),
+    [
+        # Client stored during lifespan, closed on shutdown
+        pytest.param(True, None, True, 1, 1, id="connected"),
+        # Client closed immediately when verification fails
+        pytest.param(False, None, False, 1, 1, id="connectivity_failure"),
+        pytest.param(
+            Exception("Connection failed"),
+            None,
+            False,
+            1,
+            0,
+            id="connectivity_exception",
+        ),
+        pytest.param(
+            True,
+            Exception("Invalid configuration"),
+            False,
+            0,
+            0,
+            id="client_creation_error",
+        ),
+    ],
+)
+async def test_lifespan_manages_neo4j_client(
+    main_module: ModuleType,
+    mock_neo4j_client: Mock,
+    bare_app: FastAPI,
+    mock_neo4j_client_cls: Mock,
+    verify_result: bool | Exception,
+    creation_error: Exception | None,
+    client_stored: bool,
+    verify_calls: int,
+    close_calls: int,
+) -> None:
+    """Test that lifespan creates, verifies and closes the Neo4j client.
 
-    with patch("app.main.Neo4jClient", return_value=mock_client):
-        from app.main import lifespan
+    Startup and connectivity errors must not propagate; they leave
+    app.state.neo4j_client set to None instead.
 
-        test_app = FastAPI()
+    Args:
+        main_module: The app.main module.
+        mock_neo4j_client: Shared mock Neo4jClient instance.
+        bare_app: Bare app standing in for the application.
+        mock_neo4j_client_cls: Mock Neo4jClient class installed in app.main.
+        verify_result: Result of verify_connectivity(), or the exception it raises.
+        creation_error: Exception raised by the Neo4jClient constructor, if any.
+        client_stored: Whether the client should be stored in app state.
+        verify_calls: Expected number of verify_connectivity() calls.
+        close_calls: Expected number of close() calls.
+    """
+    if isinstance(verify_result, Exception):
+        mock_neo4j_client.verify_connectivity.side_effect = verify_result
+    else:
+        mock_neo4j_client.verify_connectivity.return_value = verify_result
+    mock_neo4j_client_cls.side_effect = creation_error
 
-        # Should not raise, just log warning
-        async with lifespan(test_app):
-            # Client should be set to None after connectivity failure
-            assert hasattr(test_app.state, "neo4j_client")
-            assert test_app.state.neo4j_client is None
+    # Should not raise, just log errors
+    async with main_module.lifespan(bare_app):
+        # lifespan must always write the state, even when startup fails
+        assert hasattr(bare_app.state, "neo4j_client")
+        expected = mock_neo4j_client if client_stored else None
+        assert bare_app.state.neo4j_client is expected
 
-        # Connectivity check was attempted
-        mock_client.verify_connectivity.assert_called_once()
-        # Client should be closed immediately when verification fails
-        mock_client.close.assert_called_once()
+    mock_neo4j_client_cls.assert_called_once()
+    assert mock_neo4j_client.verify_connectivity.call_count == verify_calls
+    assert mock_neo4j_client.close.call_count == close_calls
 
 
 def test_get_neo4j_client_returns_client(
-    settings_fixture: Settings,
-    mock_neo4j_client_class: MagicMock,
+    main_module: ModuleType,
+    bare_app: FastAPI,
 ) -> None:
     """Test that get_neo4j_client returns the initialized client.
 
     Args:
-        settings_fixture: Test settings fixture.
-        mock_neo4j_client_class: Mock Neo4jClient class.
+        main_module: The app.main module.
+        bare_app: Bare app standing in for the application.
     """
-    from app.main import app, get_neo4j_client
-
-    # Set client in app state
-    app.state.neo4j_client = mock_neo4j_client_class
+    # Only identity is checked, so any object will do
+    neo4j_client = object()
+    bare_app.state.neo4j_client = neo4j_client
 
-    # Create mock request
-    mock_request = MagicMock()
-    mock_request.app = app
+    # Only request.app is read
+    mock_request = SimpleNamespace(app=bare_app)
 
-    client = get_neo4j_client(mock_request)
-    assert client is mock_neo4j_client_class
+    client = main_module.get_neo4j_client(mock_request)
+    assert client is neo4j_client
 
 
 def test_get_neo4j_client_raises_when_not_initialized(
-    settings_fixture: Settings,
+    main_module: ModuleType,
+    bare_app: FastAPI,
 ) -> None:
     """Test that get_neo4j_client raises RuntimeError when client not initialized.
 
     Args:
-        settings_fixture: Test settings fixture.
+        main_module: The app.main module.
+        bare_app: Bare app standing in for the application.
     """
-    from app.main import app, get_neo4j_client
-
     # Set client to None in app state
-    app.state.neo4j_client = None
+    bare_app.state.neo4j_client = None
 
-    # Create mock request
-    mock_request = MagicMock()
-    mock_request.app = app
+    # Only request.app is read
+    mock_request = SimpleNamespace(app=bare_app)
 
     with pytest.raises(RuntimeError, match="Neo4j client not initialized"):
-        get_neo4j_client(mock_request)
+        main_module.get_neo4j_client(mock_request)
 
 
-def test_app_has_lifespan_configured(settings_fixture: Settings) -> None:
+def test_app_has_lifespan_configured(main_module: ModuleType) -> None:
     """Test that app has lifespan context manager configured.
 
     Args:
-        settings_fixture: Test settings fixture.
+        main_module: The app.main module.
     """
-    from app.main import app
-
     # FastAPI stores lifespan in router.lifespan_context
-    assert app.router.lifespan_context is not None
+    assert main_module.app.router.lifespan_context is not None